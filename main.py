@@ -15,6 +15,7 @@ Dependencies:
     - uvicorn
     - lxml
     - Jinja2
+    - itsdangerous
 
 Developed by Dr. Buhlmeier Consulting Enterprise IT Intelligence.
 """
@@ -24,82 +25,409 @@ from fastapi import FastAPI, UploadFile, File, Request, WebSocket
 from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
+from starlette.middleware.sessions import SessionMiddleware
+from starlette.websockets import WebSocketState
 import uvicorn
 import asyncio
 from datetime import datetime
 import time
 import webbrowser
 import threading
-import socket
 import zipfile
-import io
+import itertools
+import multiprocessing
+import hashlib
+import re
+import secrets
+import sys
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from urllib.parse import quote
 from lxml import etree
 import logging
-
-last_report_data = {
-    "filename": None,
-    "descriptions": None
-}
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import queue
 
 base_dir = Path(__file__).resolve().parent
+# Upload bodies larger than this are rejected with 413 while they are being received
+MAX_UPLOAD_BYTES = int(os.environ.get("MAX_UPLOAD_BYTES", 64 * 1024 * 1024))
+
+# Number of uvicorn worker processes; the CPU cores are shared among their parse pools
+WORKERS = int(os.environ.get("UVICORN_WORKERS", 1))
+PARSE_POOL_WORKERS = max(1, (os.cpu_count() or 1) // WORKERS)
+
+# Parsed descriptions of recent uploads, keyed by the BLAKE2b digest of the file (LRU)
+PARSE_CACHE_SIZE = 32
+_PARSE_CACHE: "OrderedDict[bytes, list]" = OrderedDict()
+# Per-digest lock and the number of uploads holding or waiting for it
+_PARSE_LOCKS: "dict[bytes, list]" = {}
+
+# Last report per browser session: sid -> (filename, descriptions, expires_at)
+REPORT_TTL_SECONDS = 60 * 60
+_REPORTS: "dict[str, tuple]" = {}
+_REPORTS_LOCK = asyncio.Lock()
+
 log_file = "Parser.log"
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.FileHandler(log_file, mode='a', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+# Only this many bytes from the end of the log file are read to find the latest lines
+LOG_TAIL_BYTES = 8192
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+def start_logging():
+    """Routes log records through a queue to a background thread writing the log file.
+
+    Called from the serving process only, so neither the parse pool's children nor
+    the reloader's parent open the log file. The file is only rotated when a single
+    worker writes to it; rotating from several processes would overwrite backups.
+
+    Returns:
+        tuple: The started QueueListener and the QueueHandler added to the root logger.
+    """
+    if WORKERS == 1:
+        file_handler = RotatingFileHandler(log_file, mode='a', maxBytes=5_000_000, backupCount=3, encoding='utf-8')
+    else:
+        file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(queue_handler)
+    log_listener = QueueListener(log_queue, file_handler, logging.StreamHandler())
+    log_listener.start()
+    return log_listener, queue_handler
+
+def stop_logging(log_listener, queue_handler):
+    """Flushes pending log records and detaches the queue from the root logger.
+
+    Args:
+        log_listener (QueueListener): Listener returned by `start_logging`.
+        queue_handler (QueueHandler): Handler returned by `start_logging`.
+    """
+    logging.getLogger().removeHandler(queue_handler)
+    log_listener.stop()
+    for handler in log_listener.handlers:
+        handler.close()
+
+def new_parse_pool():
+    """Creates the process pool used to parse slide XML across CPU cores.
+
+    The serving process already runs the log listener and executor threads, so
+    the workers are started with forkserver (spawn where it is unavailable)
+    rather than by forking a multi-threaded process.
+
+    Returns:
+        ProcessPoolExecutor: Pool with PARSE_POOL_WORKERS processes.
+    """
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=PARSE_POOL_WORKERS, mp_context=multiprocessing.get_context(start_method))
+
+@asynccontextmanager
+async def lifespan(app):
+    """Manages application-wide resources for the lifetime of the server.
+
+    Starts logging and creates the process pool used to parse slide XML across
+    CPU cores.
+
+    Args:
+        app (FastAPI): The application being started.
+    """
+    log_handlers = start_logging()
+    if WORKERS > 1:
+        logger.warning(
+            f"Running with {WORKERS} workers: reports are kept in each worker's memory, so "
+            "/download-report fails when it reaches a different worker than the upload."
+        )
+    app.state.parse_pool = new_parse_pool()
+    try:
+        yield
+    finally:
+        app.state.parse_pool.shutdown()
+        stop_logging(*log_handlers)
+
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(SessionMiddleware, secret_key=os.environ.get("SESSION_SECRET") or secrets.token_urlsafe(32))
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
 
-def extract_picture_descriptions(pptx_bytes):
+# Clark-notation tag of the non-visual drawing properties holding the `descr` attribute
+CNVPR_TAG = '{http://schemas.openxmlformats.org/presentationml/2006/main}cNvPr'
+_NO_DESC = sys.intern("(No description)")
+SLIDE_FEED_SIZE = 64 * 1024
+
+_parser_local = threading.local()
+
+def _get_slide_parser():
+    """Returns the calling thread's reusable slide parser, creating it on first use.
+
+    The parser skips entity resolution and ID collection, which slide XML never
+    needs, so no DTD/entity tables are allocated and XXE payloads are not expanded.
+
+    Returns:
+        XMLPullParser: Feed parser reporting the `end` events of `p:cNvPr` elements.
+    """
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = _parser_local.parser = etree.XMLPullParser(
+            events=('end',), tag=CNVPR_TAG,
+            collect_ids=False, resolve_entities=False, huge_tree=False, remove_blank_text=True
+        )
+    return parser
+
+def _drain_descriptions(parser, append):
+    """Collects the descriptions of the `p:cNvPr` elements parsed so far.
+
+    Everything before each match is dropped from the partial tree, so only the
+    path from the root to the current element stays in memory.
+
+    Args:
+        parser (XMLPullParser): Parser returned by `_get_slide_parser`.
+        append (callable): Receives the description of each element.
+    """
+    for _, pic in parser.read_events():
+        append(pic.get('descr') or _NO_DESC)
+        pic.clear(keep_tail=True)
+        node = pic
+        while (parent := node.getparent()) is not None:
+            while node.getprevious() is not None:
+                del parent[0]
+            node = parent
+
+def _parse_slide(raw):
+    """Extracts image descriptions from a single slide's XML.
+
+    The slide is fed to the parser in SLIDE_FEED_SIZE chunks and the matches are
+    collected between chunks, so the full tree is never built.
+    Kept at module level so it can be pickled and run in a worker process.
+
+    Args:
+        raw (bytes): The XML content of one `ppt/slides/slideN.xml` entry.
+
+    Returns:
+        list: The descriptions of all `p:cNvPr` elements on the slide.
+    """
+    slide_descriptions = []
+    append = slide_descriptions.append
+    parser = _get_slide_parser()
+    try:
+        for offset in range(0, len(raw), SLIDE_FEED_SIZE):
+            parser.feed(raw[offset:offset + SLIDE_FEED_SIZE])
+            _drain_descriptions(parser, append)
+        root = parser.close()
+    except etree.XMLSyntaxError:
+        _parser_local.parser = None
+        raise
+    _drain_descriptions(parser, append)
+    # The reused parser would otherwise keep the last slide's tree alive
+    root.clear()
+    return slide_descriptions
+
+# Slide parts of the package; the group holds the slide number used for ordering
+_SLIDE_RE = re.compile(r'ppt/slides/slide(\d+)\.xml')
+
+def _parse_slides(batch):
+    """Extracts image descriptions from a batch of slides in one worker task.
+
+    Args:
+        batch (list): The XML contents of several slides.
+
+    Returns:
+        list: One list of descriptions per slide, in the order of `batch`.
+    """
+    return [_parse_slide(raw) for raw in batch]
+
+def _batch_slides(payloads, batch_bytes):
+    """Groups consecutive slides into batches of at least `batch_bytes` of XML.
+
+    Args:
+        payloads (list): The XML contents of the slides.
+        batch_bytes (int): Size at which a batch is closed.
+
+    Returns:
+        list: Lists of slide contents, preserving the slide order.
+    """
+    batches = []
+    batch = []
+    size = 0
+    for raw in payloads:
+        batch.append(raw)
+        size += len(raw)
+        if size >= batch_bytes:
+            batches.append(batch)
+            batch = []
+            size = 0
+    if batch:
+        batches.append(batch)
+    return batches
+
+# Limits checked against the zip central directory before any slide is decompressed
+ZIP_SIGNATURE = b'PK\x03\x04'
+MAX_SLIDES = 1000
+MAX_SLIDE_BYTES = 32 * 1024 * 1024
+# All slides are held in memory at once while parsing, so their total is capped too
+MAX_TOTAL_SLIDE_BYTES = 256 * 1024 * 1024
+MAX_COMPRESSION_RATIO = 100
+# Below this much distinct slide XML, handing it to the process pool costs more than it saves
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
+def extract_picture_descriptions(pptx_file, executor=None):
     """Extracts image descriptions from a .pptx file's slide XML.
 
     Args:
-        pptx_bytes (bytes): The binary content of the uploaded PPTX file.
+        pptx_file (file-like): Seekable binary file object holding the uploaded PPTX file.
+        executor (Executor, optional): Pool used to parse the slides concurrently.
+            Slides are parsed in the calling thread if omitted, or if the distinct
+            slides hold less than PARALLEL_MIN_BYTES of XML.
 
     Returns:
         list: A list of dictionaries containing slide numbers and image descriptions.
 
     Raises:
+        ValueError: If the file is not a zip archive or exceeds the slide size limits.
         Exception: If parsing fails or the .pptx structure is invalid.
     """
     slides_output = []
     try:
-        with zipfile.ZipFile(io.BytesIO(pptx_bytes)) as pptx_zip:
+        if pptx_file.read(4) != ZIP_SIGNATURE:
+            raise ValueError("File is not a valid .pptx (zip) archive")
+        archive_size = pptx_file.seek(0, os.SEEK_END)
+        pptx_file.seek(0)
+
+        with zipfile.ZipFile(pptx_file) as pptx_zip:
             slide_files = sorted(
-                [f for f in pptx_zip.namelist() if f.startswith('ppt/slides/slide') and f.endswith('.xml')],
-                key=lambda x: int(''.join(filter(str.isdigit, x)))
+                [f for f in pptx_zip.namelist() if _SLIDE_RE.fullmatch(f) is not None],
+                key=lambda x: int(_SLIDE_RE.fullmatch(x).group(1))
             )
             logger.info(f"Found {len(slide_files)} slide(s) to scan")
-
-            for index, slide_file in enumerate(slide_files, start=1):
-                slide_descriptions = []
-                with pptx_zip.open(slide_file) as file:
-                    tree = etree.parse(file)
-                    for pic in tree.xpath('//p:cNvPr', namespaces={
-                        'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
-                        'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'
-                    }):
-                        descr = pic.get('descr')
-                        desc = descr if descr else "(No description)"
-                        slide_descriptions.append(desc)
-
-                slides_output.append({
-                    "slide": index,
-                    "descriptions": slide_descriptions
-                })
+            if len(slide_files) > MAX_SLIDES:
+                raise ValueError(f"Presentation has more than {MAX_SLIDES} slides")
+            slide_sizes = [pptx_zip.getinfo(f).file_size for f in slide_files]
+            if any(size > MAX_SLIDE_BYTES for size in slide_sizes):
+                raise ValueError(f"A slide is larger than {MAX_SLIDE_BYTES} bytes uncompressed")
+            if sum(slide_sizes) > MAX_TOTAL_SLIDE_BYTES:
+                raise ValueError(f"Slides are larger than {MAX_TOTAL_SLIDE_BYTES} bytes uncompressed in total")
+            if sum(slide_sizes) > MAX_COMPRESSION_RATIO * archive_size:
+                raise ValueError("Slides are suspiciously highly compressed")
+            slide_bytes = [pptx_zip.read(f) for f in slide_files]
+
+        # Templated decks often repeat slides byte for byte; parse each distinct payload once
+        digests = [hashlib.sha1(raw).digest() for raw in slide_bytes]
+        unique_slides = dict(zip(digests, slide_bytes))
+        payloads = list(unique_slides.values())
+        total_bytes = sum(map(len, payloads))
+        if executor is not None and PARSE_POOL_WORKERS > 1 and total_bytes >= PARALLEL_MIN_BYTES:
+            # About four batches of similar size per pool process, so pickling and IPC
+            # stay small against the parse itself while the load is still balanced
+            batches = _batch_slides(payloads, total_bytes // (PARSE_POOL_WORKERS * 4))
+            results = itertools.chain.from_iterable(executor.map(_parse_slides, batches))
+        else:
+            results = map(_parse_slide, payloads)
+        parsed = dict(zip(unique_slides, results))
+        for index, digest in enumerate(digests, start=1):
+            slides_output.append({
+                "slide": index,
+                "descriptions": parsed[digest]
+            })
         return slides_output
 
     except Exception as e:
         logger.exception("Error occurred while extracting descriptions")
         raise
 
+def upload_digest(pptx_file):
+    """Hashes an uploaded file for the parse cache and rewinds it.
+
+    Args:
+        pptx_file (file-like): Seekable binary file object holding the uploaded PPTX file.
+
+    Returns:
+        bytes: BLAKE2b digest of the file content.
+    """
+    pptx_file.seek(0)
+    digest = hashlib.file_digest(pptx_file, lambda: hashlib.blake2b(digest_size=16)).digest()
+    pptx_file.seek(0)
+    return digest
+
+async def cached_picture_descriptions(key, pptx_file, executor=None):
+    """Returns the descriptions of a .pptx file, parsing it only if it is not cached.
+
+    Concurrent uploads of the same file wait for a single parse instead of
+    repeating it.
+
+    Args:
+        key (bytes): Content hash of the uploaded file.
+        pptx_file (file-like): Seekable binary file object holding the uploaded PPTX file.
+        executor (Executor, optional): Pool used to parse the slides concurrently.
+
+    Returns:
+        list: A list of dictionaries containing slide numbers and image descriptions.
+    """
+    entry = _PARSE_LOCKS.setdefault(key, [asyncio.Lock(), 0])
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            if key in _PARSE_CACHE:
+                _PARSE_CACHE.move_to_end(key)
+                logger.info("Reusing cached descriptions for identical upload")
+                return _PARSE_CACHE[key]
+
+            descriptions = await asyncio.get_running_loop().run_in_executor(
+                None, extract_picture_descriptions, pptx_file, executor
+            )
+            _PARSE_CACHE[key] = descriptions
+            if len(_PARSE_CACHE) > PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+            return descriptions
+    finally:
+        # Keep the lock while uploads still wait on it, so they stay serialized
+        entry[1] -= 1
+        if entry[1] == 0:
+            del _PARSE_LOCKS[key]
+
+def session_id(request):
+    """Returns the id of the client's session, assigning one on first visit.
+
+    Args:
+        request (Request): FastAPI request object.
+
+    Returns:
+        str: Random id stored in the signed session cookie.
+    """
+    if "sid" not in request.session:
+        request.session["sid"] = secrets.token_urlsafe(16)
+    return request.session["sid"]
+
+async def store_report(sid, filename, descriptions):
+    """Stores the last report of a session and drops expired ones.
+
+    Args:
+        sid (str): Session id of the client.
+        filename (str): Name of the uploaded file.
+        descriptions (list): Extracted slide descriptions.
+    """
+    now = time.monotonic()
+    async with _REPORTS_LOCK:
+        for key in [key for key, (_, _, expires_at) in _REPORTS.items() if expires_at <= now]:
+            del _REPORTS[key]
+        _REPORTS[sid] = (filename, descriptions, now + REPORT_TTL_SECONDS)
+
+async def load_report(sid):
+    """Returns the last report of a session.
+
+    Args:
+        sid (str): Session id of the client.
+
+    Returns:
+        tuple: The filename and descriptions, or None if there is no unexpired report.
+    """
+    async with _REPORTS_LOCK:
+        report = _REPORTS.get(sid)
+        if report is None or report[2] <= time.monotonic():
+            return None
+        return report[:2]
+
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
     """Serves the homepage with the file upload form.
@@ -110,6 +438,7 @@ async def index(request: Request):
     Returns:
         TemplateResponse: Rendered HTML template.
     """
+    session_id(request)
     return templates.TemplateResponse("index.html", {
         "request": request,
         "descriptions": None,
@@ -117,6 +446,92 @@ async def index(request: Request):
         "context": {"title": "FastAPI Streaming Log Viewer", "log_file": log_file}
     })
 
+def replace_broken_parse_pool(app, pool):
+    """Replaces the slide parsing pool after one of its worker processes died.
+
+    A ProcessPoolExecutor stays broken once a worker is killed (e.g. out of memory),
+    which would otherwise fail every later upload until the server is restarted.
+
+    Args:
+        app (FastAPI): The application owning the pool.
+        pool (ProcessPoolExecutor): The pool that raised BrokenProcessPool.
+    """
+    if getattr(app.state, "parse_pool", None) is not pool:
+        return  # Already replaced by a concurrent upload
+    logger.warning("Slide parsing pool is broken; starting a new one")
+    pool.shutdown(wait=False, cancel_futures=True)
+    app.state.parse_pool = new_parse_pool()
+
+def upload_too_large(request):
+    """Builds the response for an upload exceeding MAX_UPLOAD_BYTES.
+
+    Args:
+        request (Request): Request of the rejected upload.
+
+    Returns:
+        TemplateResponse: HTML page with the error and status 413.
+    """
+    logger.warning(f"Rejected upload (larger than {MAX_UPLOAD_BYTES} bytes)")
+    return templates.TemplateResponse("index.html", {
+        "request": request,
+        "error": f"File is too large. The maximum size is {MAX_UPLOAD_BYTES // (1024 * 1024)} MB.",
+        "descriptions": None
+    }, status_code=413)
+
+class _UploadTooLarge(Exception):
+    """Raised from the wrapped `receive` once a request body passes the size limit."""
+
+class UploadSizeLimitMiddleware:
+    """ASGI middleware enforcing MAX_UPLOAD_BYTES on a route before its form is parsed.
+
+    FastAPI receives and spools the whole multipart body before the endpoint runs,
+    so the limit is checked here: on the `Content-Length` header first, then on the
+    body bytes as they arrive. Once the limit is crossed the endpoint's response is
+    discarded and a 413 page is sent instead.
+    """
+
+    def __init__(self, app, path, max_bytes):
+        self.app = app
+        self.path = path
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] != self.path:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_bytes:
+            await upload_too_large(request)(scope, receive, send)
+            return
+
+        received = 0
+        exceeded = False
+
+        async def limited_receive():
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    exceeded = True
+                    raise _UploadTooLarge()
+            return message
+
+        async def guarded_send(message):
+            if not exceeded:
+                await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except _UploadTooLarge:
+            pass
+        if exceeded:
+            await upload_too_large(request)(scope, receive, send)
+
+app.add_middleware(UploadSizeLimitMiddleware, path="/upload-form", max_bytes=MAX_UPLOAD_BYTES)
+
 @app.post("/upload-form", response_class=HTMLResponse)
 async def upload_form(request: Request, file: UploadFile = File(...)):
     """Handles .pptx file upload and description extraction.
@@ -137,17 +552,15 @@ async def upload_form(request: Request, file: UploadFile = File(...)):
             "descriptions": None
         })
 
-    content = await file.read()
+    # Without the lifespan handler (e.g. a mounted sub-app) there is no pool; parse inline
+    parse_pool = getattr(request.app.state, "parse_pool", None)
+    # The upload is already spooled by Starlette; file.file is a seekable SpooledTemporaryFile
     try:
-        descriptions = extract_picture_descriptions(content)
-        logger.info(f"Extracted picture descriptions from {file.filename}")
-        last_report_data["filename"] = file.filename
-        last_report_data["descriptions"] = descriptions
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "descriptions": descriptions
-        })
+        digest = await asyncio.get_running_loop().run_in_executor(None, upload_digest, file.file)
+        descriptions = await cached_picture_descriptions(digest, file.file, parse_pool)
     except Exception as e:
+        if isinstance(e, BrokenProcessPool):
+            replace_broken_parse_pool(request.app, parse_pool)
         logger.error(f"Failed to parse file {file.filename}: {str(e)}")
         return templates.TemplateResponse("index.html", {
             "request": request,
@@ -155,53 +568,103 @@ async def upload_form(request: Request, file: UploadFile = File(...)):
             "descriptions": None
         })
 
+    logger.info(f"Extracted picture descriptions from {file.filename}")
+    await store_report(session_id(request), file.filename, descriptions)
+    return templates.TemplateResponse("index.html", {
+        "request": request,
+        "descriptions": descriptions
+    })
+
 @app.get("/download-report")
-def download_report():
+async def download_report(request: Request):
     """Generates and returns a downloadable report of extracted descriptions.
 
+    Args:
+        request (Request): FastAPI request object.
+
     Returns:
         StreamingResponse: Text file containing slide-wise descriptions.
     """
-    if not last_report_data["descriptions"]:
+    report = await load_report(session_id(request))
+    if not report or not report[1]:
         return HTMLResponse(content="No report available. Please upload a file first.", status_code=400)
 
-    filename = last_report_data["filename"]
-    descriptions = last_report_data["descriptions"]
+    filename, descriptions = report
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    report_lines = [f"\U0001F4C4 Report for: {filename}", f"\U0001F551 Generated: {timestamp}", ""]
-    for slide in descriptions:
-        report_lines.append(f"Slide {slide['slide']}:")
-        for desc in slide['descriptions']:
-            report_lines.append(f"  - {desc}")
-        report_lines.append("")
+    report_name = f"report_{filename}.txt"
+    if quote(report_name) == report_name:
+        content_disposition = f'attachment; filename="{report_name}"'
+    else:
+        content_disposition = f"attachment; filename*=utf-8''{quote(report_name)}"
+
+    async def report_chunks():
+        yield f"\U0001F4C4 Report for: {filename}\n\U0001F551 Generated: {timestamp}\n"
+        for slide in descriptions:
+            yield f"\nSlide {slide['slide']}:\n" + "".join([f"  - {desc}\n" for desc in slide['descriptions']])
+
+    return StreamingResponse(report_chunks(),
+                             media_type="text/plain; charset=utf-8",
+                             headers={"Content-Disposition": content_disposition})
+
+# HTML wrappers for log lines, selected by the level name in the log format
+_LEVEL_RE = re.compile(r'\[(ERROR|WARNING)\]')
+_LEVEL_TEMPLATES = {
+    'ERROR': '<span class="text-red-400">%s</span><br/>',
+    'WARNING': '<span class="text-orange-300">%s</span><br/>',
+}
+_PLAIN_TEMPLATE = '%s<br/>'
 
-    content = "\n".join(report_lines)
-    file_like = io.StringIO(content)
+def _read_log_tail(path, n, last_mtime=None):
+    """Reads the last N lines of a log file without loading the whole file.
 
-    return StreamingResponse(file_like,
-                             media_type="text/plain",
-                             headers={"Content-Disposition": f"attachment; filename=report_{filename}.txt"})
+    Args:
+        path (str): Path of the log file.
+        n (int): Number of recent lines to read.
+        last_mtime (int, optional): Modification time (ns) of the previous read;
+            the file is not read if it is unchanged since then.
 
-async def log_reader(n=5):
+    Returns:
+        tuple: The file's modification time (ns) and the raw log lines including
+            their line endings, or None instead of the lines if the file is unchanged.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    if mtime == last_mtime:
+        return mtime, None
+    with open(path, "rb") as file:
+        file.seek(0, os.SEEK_END)
+        start = max(0, file.tell() - LOG_TAIL_BYTES)
+        file.seek(start)
+        tail = file.read().decode("utf-8", "replace").splitlines(keepends=True)
+    if start > 0:
+        # The first line of the block is most likely cut off
+        tail = tail[1:]
+    return mtime, tail[-n:]
+
+async def log_reader(n=5, last_mtime=None):
     """Reads the last N lines of the log file.
 
+    The file is checked and read in a worker thread so the event loop is not blocked.
+
     Args:
         n (int): Number of recent lines to read.
+        last_mtime (int, optional): Modification time (ns) returned by the previous call.
 
     Returns:
-        list: A list of HTML-formatted log lines.
+        tuple: The log file's modification time (ns) and a list of HTML-formatted
+            log lines, or None instead of the list if the file is unchanged.
     """
+    mtime, lines = await asyncio.get_running_loop().run_in_executor(
+        None, _read_log_tail, f"{base_dir}/{log_file}", n, last_mtime
+    )
+    if lines is None:
+        return mtime, None
     log_lines = []
-    with open(f"{base_dir}/{log_file}", "r", encoding="utf-8", errors="replace") as file:
-        for line in file.readlines()[-n:]:
-            if "ERROR" in line:
-                log_lines.append(f'<span class="text-red-400">{line}</span><br/>' )
-            elif "WARNING" in line:
-                log_lines.append(f'<span class="text-orange-300">{line}</span><br/>' )
-            else:
-                log_lines.append(f"{line}<br/>")
-    return log_lines
+    for line in lines:
+        match = _LEVEL_RE.search(line)
+        template = _LEVEL_TEMPLATES.get(match.group(1) if match else '', _PLAIN_TEMPLATE)
+        log_lines.append(template % line)
+    return mtime, log_lines
 
 @app.websocket("/ws/log")
 async def websocket_endpoint_log(websocket: WebSocket):
@@ -211,25 +674,60 @@ async def websocket_endpoint_log(websocket: WebSocket):
         websocket (WebSocket): WebSocket connection to the client.
     """
     await websocket.accept()
+    last_mtime = None
     try:
         while True:
-            await asyncio.sleep(1)
-            logs = await log_reader(3)
+            # Waiting on the client instead of sleeping notices a disconnect even while the log is idle
+            try:
+                message = await asyncio.wait_for(websocket.receive(), timeout=1)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                if message["type"] == "websocket.disconnect":
+                    break
+            last_mtime, logs = await log_reader(3, last_mtime)
+            if logs is None:
+                continue
             await websocket.send_text("".join(logs))
     except Exception as e:
         print(e)
     finally:
-        await websocket.close()
+        if websocket.client_state == WebSocketState.CONNECTED:
+            await websocket.close()
+
+class BrowserServer(uvicorn.Server):
+    """Uvicorn server opening the application in the browser once it is listening.
+
+    Uvicorn runs the lifespan startup before it binds the listening socket, so the
+    browser is only started after `startup()` has finished.
+    """
+
+    def __init__(self, config, url):
+        super().__init__(config=config)
+        self.url = url
+
+    async def startup(self, sockets=None):
+        await super().startup(sockets=sockets)
+        if not self.should_exit:
+            await asyncio.get_running_loop().run_in_executor(None, webbrowser.open, self.url, 1)
 
 if __name__ == "__main__":
-    """Entry point for launching the application with browser auto-open."""
-    config = uvicorn.Config(app=app, reload=True)
-    server = uvicorn.Server(config=config)
-    (sock := socket.socket()).bind(("127.0.0.1", 0))
-    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]})
-    thread.start()
-    while not server.started:
-        time.sleep(0.001)
-    address, port = sock.getsockname()
-    print(f"HTTP server is now running on http://{address}:{port}")
-    webbrowser.open(f'http://{address}:{port}', new=1)
+    """Entry point for launching the application with browser auto-open.
+
+    Runs a single worker without reloading unless UVICORN_WORKERS or
+    UVICORN_RELOAD=1 are set. The port is chosen at random unless UVICORN_PORT is set.
+    The browser is only opened for a single worker without reloading. Reports are
+    stored per worker, so more than one worker breaks /download-report.
+    """
+    host = os.environ.get("UVICORN_HOST", "127.0.0.1")
+    # Port 0 lets the OS pick a free port when the socket is bound
+    port = int(os.environ.get("UVICORN_PORT", 0))
+    reload = os.environ.get("UVICORN_RELOAD") == "1"
+    # Inherited by worker and reloader processes, so all of them accept the session cookie
+    os.environ.setdefault("SESSION_SECRET", secrets.token_urlsafe(32))
+    if WORKERS == 1 and not reload:
+        config = uvicorn.Config("main:app", host=host, port=port)
+        sock = config.bind_socket()
+        BrowserServer(config, f"http://{host}:{sock.getsockname()[1]}").run(sockets=[sock])
+    else:
+        uvicorn.run("main:app", host=host, port=port, app_dir=str(base_dir), workers=WORKERS, reload=reload)